@@ -1,6 +1,8 @@
 """HTML2exe command-line entry point."""
 
+import sys
+
 from .cli import main
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
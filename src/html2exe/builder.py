@@ -1,7 +1,10 @@
 """HTML to EXE conversion logic."""
 
+import errno
 import logging
+import os
 import shutil
+import stat
 import subprocess
 import sys
 import tempfile
@@ -10,19 +13,51 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Sibling files and folders bundled alongside a single HTML input
+_ASSET_SUFFIXES = frozenset(
+    {".css", ".js", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".ico"}
+)
+_ASSET_DIRS = frozenset({"css", "js", "images", "img", "assets", "static"})
+
+# Keep PyInstaller from flashing a console window when run from the windowed app
+if sys.platform == "win32":
+    _CREATION_FLAGS = subprocess.CREATE_NO_WINDOW
+else:
+    _CREATION_FLAGS = 0
+
+# Lines of PyInstaller output included in build failure errors
+_ERROR_OUTPUT_LINES = 50
+
+# stat() failures that Path.exists() treats as "does not exist": missing path,
+# symlink loop, and on Windows a not-ready drive or invalid name
+_MISSING_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.EBADF, errno.ELOOP})
+_MISSING_WINERRORS = frozenset({21, 123, 1921})
+
 
 def validate_input(input_path: Path) -> Path:
     """Validate and normalize input path."""
-    if not input_path.exists():
-        raise ValueError(f"Input path does not exist: {input_path}")
-
-    if input_path.is_file():
+    # A single stat answers both "does it exist" and "file or directory"
+    try:
+        mode = input_path.stat().st_mode
+    except OSError as e:
+        if (
+            e.errno in _MISSING_ERRNOS
+            or getattr(e, "winerror", None) in _MISSING_WINERRORS
+        ):
+            raise ValueError(f"Input path does not exist: {input_path}") from None
+        raise ValueError(f"Cannot access input path: {input_path}: {e}") from e
+
+    if stat.S_ISREG(mode):
         if input_path.suffix.lower() != ".html":
             raise ValueError(f"Input file must be HTML: {input_path}")
         return input_path
-    elif input_path.is_dir():
+    elif stat.S_ISDIR(mode):
         index_html = input_path / "index.html"
-        if not index_html.exists():
+        try:
+            has_index = index_html.exists()
+        except OSError as e:
+            raise ValueError(f"Cannot access input path: {input_path}: {e}") from e
+        if not has_index:
             raise ValueError(f"Directory must contain index.html: {input_path}")
         return index_html
     else:
@@ -38,14 +73,17 @@ def prepare_assets(input_path: Path, temp_dir: Path) -> Path:
         # Single HTML file
         shutil.copy2(input_path, assets_dir / "index.html")
 
-        # Copy any assets in the same directory
-        parent_dir = input_path.parent
-        for item in parent_dir.iterdir():
-            if item.is_file() and item != input_path:
-                if item.suffix.lower() in {".css", ".js", ".png", ".jpg", ".jpeg", ".gif", ".svg", ".ico"}:
-                    shutil.copy2(item, assets_dir / item.name)
-            elif item.is_dir() and item.name in {"css", "js", "images", "img", "assets", "static"}:
-                shutil.copytree(item, assets_dir / item.name, dirs_exist_ok=True)
+        # Copy any assets in the same directory; scandir entries carry their
+        # file type, so each item needs no extra stat
+        with os.scandir(input_path.parent) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name != input_path.name:
+                    if Path(entry.name).suffix.lower() in _ASSET_SUFFIXES:
+                        shutil.copy2(entry.path, assets_dir / entry.name)
+                elif entry.is_dir() and entry.name in _ASSET_DIRS:
+                    shutil.copytree(
+                        entry.path, assets_dir / entry.name, dirs_exist_ok=True
+                    )
     else:
         # Directory with index.html
         shutil.copytree(input_path, assets_dir, dirs_exist_ok=True)
@@ -153,9 +191,19 @@ def run_pyinstaller(viewer_script: Path, assets_dir: Path, output_path: Path, ch
 
     logger.debug(f"PyInstaller command: {' '.join(cmd)}")
 
-    result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+    result = subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        creationflags=_CREATION_FLAGS,
+    )
     logger.debug(f"PyInstaller output: {result.stdout}")
 
+    if result.returncode != 0:
+        tail = "\n".join(result.stdout.splitlines()[-_ERROR_OUTPUT_LINES:])
+        raise RuntimeError(f"PyInstaller failed with exit code {result.returncode}:\n{tail}")
+
     if not output_path.exists():
         raise RuntimeError(f"EXE was not created: {output_path}")
 
@@ -2,6 +2,7 @@
 
 import argparse
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -65,29 +66,22 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@lru_cache(maxsize=None)
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the shared argument parser, building it on first use."""
+    return create_parser()
+
+
 def main(argv: Optional[list[str]] = None) -> int:
     """Main CLI entry point."""
-    parser = create_parser()
+    parser = _get_parser()
     args = parser.parse_args(argv)
 
     # Setup logging
     setup_logging(verbose=args.verbose)
 
     try:
-        # Validate inputs
-        if not args.input.exists():
-            print(f"Error: Input path does not exist: {args.input}", file=sys.stderr)
-            return 1
-
-        if args.input.is_file() and args.input.suffix.lower() != ".html":
-            print(f"Error: Input file must be HTML: {args.input}", file=sys.stderr)
-            return 1
-
-        if args.input.is_dir() and not (args.input / "index.html").exists():
-            print(f"Error: Directory must contain index.html: {args.input}", file=sys.stderr)
-            return 1
-
-        # Convert
+        # Convert (input validation happens once, in builder.validate_input)
         convert_html_to_exe(args.input, args.output, args.title, args.width, args.height, args.check)
         return 0
 
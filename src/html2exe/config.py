@@ -1,14 +1,19 @@
 """Configuration management for HTML2exe."""
 
+import copy
 import sys
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 if sys.version_info >= (3, 11):
     import tomllib
 else:
     import tomli as tomllib
 
+# Parsed config files keyed by path, reused while the file's mtime and size
+# are unchanged; instances always receive their own copy
+_load_cache: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
 
 class Config:
     """Configuration manager."""
@@ -24,14 +29,25 @@ class Config:
 
     def load(self) -> None:
         """Load configuration from file."""
-        if self.config_path.exists():
-            try:
-                with open(self.config_path, "rb") as f:
-                    self._data = tomllib.load(f)
-            except Exception:
-                self._data = {}
-        else:
+        try:
+            st = self.config_path.stat()
+        except OSError:
             self._data = self._get_defaults()
+            return
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _load_cache.get(self.config_path)
+        if cached is not None and cached[0] == stamp:
+            self._data = copy.deepcopy(cached[1])
+            return
+
+        try:
+            with open(self.config_path, "rb") as f:
+                data = tomllib.load(f)
+        except Exception:
+            data = {}
+        _load_cache[self.config_path] = (stamp, data)
+        self._data = copy.deepcopy(data)
 
     def _get_defaults(self) -> Dict[str, Any]:
         """Get default configuration values."""
@@ -1,15 +1,12 @@
 """HTML viewer using pywebview for testing."""
 
+import os
 import sys
 import tempfile
 import shutil
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
-
-try:
-    import webview
-except ImportError:
-    webview = None
+from typing import Iterator, Optional
 
 
 class HTMLViewer:
@@ -22,20 +19,40 @@ class HTMLViewer:
         self._temp_dir: Optional[Path] = None
 
     def extract_assets(self, assets_source: Path) -> Path:
-        """Extract HTML assets to temp directory."""
+        """Extract HTML assets to temp directory.
+
+        Files are hard-linked rather than copied where the filesystem allows
+        it, so the extracted tree must be treated as read-only.
+        """
         if not assets_source.exists():
             raise RuntimeError(f"Assets not found: {assets_source}")
 
         self._temp_dir = Path(tempfile.mkdtemp(prefix="html2exe_"))
         assets_dir = self._temp_dir / "html_assets"
-        shutil.copytree(assets_source, assets_dir)
+        try:
+            shutil.copytree(assets_source, assets_dir, copy_function=os.link)
+        except OSError:
+            # Cross-device or unsupported filesystem: fall back to a real copy
+            shutil.rmtree(assets_dir, ignore_errors=True)
+            shutil.copytree(assets_source, assets_dir)
 
         return assets_dir
 
+    @contextmanager
+    def view(self, assets_source: Path) -> Iterator[Path]:
+        """Extract HTML assets for the duration of a with-block."""
+        try:
+            yield self.extract_assets(assets_source)
+        finally:
+            self.cleanup()
+
     def show(self, html_path: Path, debug: bool = False) -> None:
         """Show HTML in webview window."""
-        if webview is None:
-            raise RuntimeError("pywebview is required but not installed")
+        # Imported lazily so extracting assets never loads the GUI backend
+        try:
+            import webview
+        except ImportError:
+            raise RuntimeError("pywebview is required but not installed") from None
 
         if not html_path.exists():
             raise RuntimeError(f"HTML file not found: {html_path}")
@@ -55,9 +72,6 @@ class HTMLViewer:
 
     def cleanup(self) -> None:
         """Clean up temporary files."""
-        if self._temp_dir and self._temp_dir.exists():
-            shutil.rmtree(self._temp_dir)
+        if self._temp_dir is not None:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
             self._temp_dir = None
-
-    def __del__(self) -> None:
-        self.cleanup()
@@ -0,0 +1,19 @@
+"""Shared pytest fixtures."""
+
+from pathlib import Path
+
+import pytest
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+@pytest.fixture(scope="session")
+def single_html_fixture() -> Path:
+    """Single-file HTML app checked into tests/fixtures."""
+    return FIXTURES_DIR / "app.html"
+
+
+@pytest.fixture(scope="session")
+def project_html_fixture() -> Path:
+    """Multi-file HTML project directory checked into tests/fixtures."""
+    return FIXTURES_DIR / "myproject"
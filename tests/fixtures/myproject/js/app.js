@@ -0,0 +1,6 @@
+document.addEventListener('DOMContentLoaded', function() {
+    console.log('Multi-file project loaded');
+    document.querySelector('h1').addEventListener('click', function() {
+        alert('Project is working!');
+    });
+});
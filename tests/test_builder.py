@@ -1,16 +1,20 @@
 """Tests for builder module."""
 
+import subprocess
+import sys
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
 
 import pytest
 
+from html2exe import builder
 from html2exe.builder import (
     convert_html_to_exe,
     prepare_assets,
     validate_input,
     create_viewer_script,
+    run_pyinstaller,
 )
 
 
@@ -22,6 +26,38 @@ class TestValidateInput:
         with pytest.raises(ValueError, match="does not exist"):
             validate_input(Path("nonexistent.html"))
 
+    def test_unstattable_path(self, tmp_path):
+        """Test a path that cannot be stat'ed is reported as nonexistent."""
+        loop = tmp_path / "loop.html"
+        try:
+            loop.symlink_to(loop)
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not supported")
+
+        with pytest.raises(ValueError, match="does not exist"):
+            validate_input(loop)
+
+    def test_permission_denied(self, tmp_path):
+        """Test access errors are not reported as a missing path."""
+        html_path = tmp_path / "app.html"
+        denied = PermissionError(13, "Permission denied")
+
+        with patch.object(Path, "stat", side_effect=denied):
+            with pytest.raises(
+                ValueError, match="Cannot access input path"
+            ) as exc_info:
+                validate_input(html_path)
+
+        assert exc_info.value.__cause__ is denied
+
+    def test_directory_index_permission_denied(self, tmp_path):
+        """Test access errors while checking for index.html are reported."""
+        denied = PermissionError(13, "Permission denied")
+
+        with patch.object(Path, "exists", side_effect=denied):
+            with pytest.raises(ValueError, match="Cannot access input path"):
+                validate_input(tmp_path)
+
     def test_valid_html_file(self):
         """Test valid HTML file."""
         with tempfile.NamedTemporaryFile(suffix=".html", delete=False) as f:
@@ -85,6 +121,40 @@ class TestPrepareAssets:
             assert (assets_dir / "index.html").exists()
             assert (assets_dir / "style.css").exists()
 
+    def test_single_html_file_sibling_filtering(self):
+        """Test only known asset files and folders are copied for a single file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_dir = Path(temp_dir) / "source"
+            source_dir.mkdir()
+            html_file = source_dir / "test.html"
+            html_file.write_text("<html><body>Test</body></html>")
+            (source_dir / "style.css").write_text("body { margin: 0; }")
+            (source_dir / "notes.txt").write_text("not an asset")
+            (source_dir / "images").mkdir()
+            (source_dir / "images" / "logo.PNG").write_bytes(b"png")
+            (source_dir / "private").mkdir()
+
+            assets_dir = prepare_assets(html_file, Path(temp_dir))
+
+            assert (assets_dir / "style.css").exists()
+            assert (assets_dir / "images" / "logo.PNG").exists()
+            assert not (assets_dir / "notes.txt").exists()
+            assert not (assets_dir / "private").exists()
+
+    def test_single_file_input_not_copied_twice(self):
+        """Test the input file is not also copied as its own sibling asset."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source_dir = Path(temp_dir) / "source"
+            source_dir.mkdir()
+            # An asset suffix, so only the self-exclusion check keeps it out
+            input_file = source_dir / "page.svg"
+            input_file.write_text("<svg></svg>")
+
+            assets_dir = prepare_assets(input_file, Path(temp_dir))
+
+            assert (assets_dir / "index.html").exists()
+            assert not (assets_dir / "page.svg").exists()
+
     def test_directory_with_assets(self):
         """Test preparing assets from directory."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -129,6 +199,45 @@ class TestCreateViewerScript:
             assert "webview.create_window" in content
 
 
+class TestRunPyinstaller:
+    """Test PyInstaller invocation."""
+
+    @patch("html2exe.builder.subprocess.run")
+    def test_failure_includes_output_tail(self, mock_run):
+        """Test a failed build raises with the end of PyInstaller's output."""
+        output = "\n".join(f"line {i}" for i in range(100))
+        mock_run.return_value = Mock(returncode=1, stdout=output)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            with pytest.raises(RuntimeError, match="exit code 1") as exc_info:
+                run_pyinstaller(temp_path / "viewer.py", temp_path, temp_path / "app.exe", False)
+
+        message = str(exc_info.value)
+        assert "line 99" in message
+        assert "line 50" in message
+        assert "line 49" not in message
+
+    @patch("html2exe.builder.subprocess.run")
+    def test_output_merged_into_stdout(self, mock_run):
+        """Test stderr is merged into the captured output."""
+        mock_run.return_value = Mock(returncode=1, stdout="")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            with pytest.raises(RuntimeError):
+                run_pyinstaller(temp_path / "viewer.py", temp_path, temp_path / "app.exe", False)
+
+        kwargs = mock_run.call_args[1]
+        assert kwargs["stderr"] == subprocess.STDOUT
+        assert kwargs["creationflags"] == builder._CREATION_FLAGS
+
+    @pytest.mark.skipif(sys.platform != "win32", reason="Windows-only creation flag")
+    def test_no_console_window_on_windows(self):
+        """Test PyInstaller is started without a console window on Windows."""
+        assert builder._CREATION_FLAGS == subprocess.CREATE_NO_WINDOW
+
+
 class TestConvertHtmlToExe:
     """Test full conversion process."""
 
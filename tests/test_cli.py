@@ -6,7 +6,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
-from html2exe.cli import create_parser, main
+from html2exe.cli import _get_parser, create_parser, main
 
 
 class TestCLIParser:
@@ -17,6 +17,18 @@ class TestCLIParser:
         parser = create_parser()
         assert parser.prog == "html2exe"
 
+    def test_parser_reused_across_calls(self):
+        """Test main builds the parser once and reuses it."""
+        with patch("html2exe.cli.create_parser", wraps=create_parser) as mock_create:
+            _get_parser.cache_clear()
+            try:
+                main(["--input", "nonexistent.html", "--output", "test.exe"])
+                main(["--input", "nonexistent.html", "--output", "test.exe"])
+            finally:
+                _get_parser.cache_clear()
+
+        assert mock_create.call_count == 1
+
     def test_required_arguments(self):
         """Test required arguments are enforced."""
         parser = create_parser()
@@ -71,6 +83,15 @@ class TestCLIMain:
         ])
         assert result == 1
 
+    def test_validation_error_message(self, capsys):
+        """Test validation errors are reported on stderr."""
+        result = main([
+            "--input", "nonexistent.html",
+            "--output", "test.exe"
+        ])
+        assert result == 1
+        assert "Error: Input path does not exist: nonexistent.html" in capsys.readouterr().err
+
     def test_invalid_html_file(self):
         """Test error handling for non-HTML file."""
         with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
@@ -0,0 +1,75 @@
+"""Tests for config module."""
+
+import os
+from unittest.mock import patch
+
+from html2exe import config as config_module
+from html2exe.config import Config
+
+
+class TestConfig:
+    """Test configuration loading."""
+
+    def test_defaults_when_missing(self, tmp_path):
+        """Test defaults are used when the config file does not exist."""
+        config = Config(tmp_path / "missing.toml")
+
+        assert config.get("window.width") == 1024
+        assert config.get("build.debug") is False
+        assert config.get("window.missing", "fallback") == "fallback"
+
+    def test_load_from_file(self, tmp_path):
+        """Test values are read from a TOML file."""
+        config_path = tmp_path / "config.toml"
+        config_path.write_text("[window]\nwidth = 800\n")
+
+        config = Config(config_path)
+
+        assert config.get("window.width") == 800
+        assert config.get("window.height") is None
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path):
+        """Test repeated loads of an unchanged file reuse the parsed data."""
+        config_path = tmp_path / "config.toml"
+        config_path.write_text("[window]\nwidth = 800\n")
+
+        real_load = config_module.tomllib.load
+        with patch("html2exe.config.tomllib.load", wraps=real_load) as mock_load:
+            Config(config_path)
+            config = Config(config_path)
+
+        assert mock_load.call_count == 1
+        assert config.get("window.width") == 800
+
+    def test_instances_do_not_share_data(self, tmp_path):
+        """Test changes made through one instance do not leak into another."""
+        config_path = tmp_path / "config.toml"
+        config_path.write_text("[window]\nwidth = 800\n")
+
+        Config(config_path).get("window")["width"] = 1
+
+        assert Config(config_path).get("window.width") == 800
+
+    def test_same_mtime_different_size_is_reloaded(self, tmp_path):
+        """Test a rewrite that keeps the mtime is detected by its size."""
+        config_path = tmp_path / "config.toml"
+        config_path.write_text("[window]\nwidth = 800\n")
+        stat = config_path.stat()
+        Config(config_path)
+
+        config_path.write_text("[window]\nwidth = 1280\n")
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert Config(config_path).get("window.width") == 1280
+
+    def test_modified_file_is_reloaded(self, tmp_path):
+        """Test a changed mtime invalidates the cached data."""
+        config_path = tmp_path / "config.toml"
+        config_path.write_text("[window]\nwidth = 800\n")
+        Config(config_path)
+
+        config_path.write_text("[window]\nwidth = 640\n")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert Config(config_path).get("window.width") == 640
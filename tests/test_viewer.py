@@ -1,73 +1,158 @@
 """Tests for viewer module."""
 
+import os
+import sys
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock, patch
 
 import pytest
 
 from html2exe.viewer import HTMLViewer
 
 
-class TestHTMLViewer:
-    """Test HTML viewer functionality."""
-
-    def test_initialization(self):
-        """Test viewer initialization."""
-        viewer = HTMLViewer("Test App", 800, 600)
-
-        assert viewer.title == "Test App"
-        assert viewer.width == 800
-        assert viewer.height == 600
-        assert viewer._temp_dir is None
-
-    def test_default_initialization(self):
-        """Test viewer with default parameters."""
-        viewer = HTMLViewer()
-
-        assert viewer.title == "HTML2exe"
-        assert viewer.width == 1024
-        assert viewer.height == 768
-
-    def test_extract_assets(self):
-        """Test asset extraction."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create source assets
-            source_dir = Path(temp_dir) / "source"
-            source_dir.mkdir()
-            (source_dir / "index.html").write_text("<html><body>Test</body></html>")
-            (source_dir / "style.css").write_text("body { margin: 0; }")
-
-            viewer = HTMLViewer()
-            try:
-                assets_dir = viewer.extract_assets(source_dir)
-
-                assert assets_dir.exists()
-                assert (assets_dir / "index.html").exists()
-                assert (assets_dir / "style.css").exists()
-                assert viewer._temp_dir is not None
-            finally:
-                viewer.cleanup()
-
-    def test_extract_nonexistent_assets(self):
-        """Test error handling for nonexistent assets."""
-        viewer = HTMLViewer()
-
-        with pytest.raises(RuntimeError, match="Assets not found"):
-            viewer.extract_assets(Path("nonexistent"))
-
-    def test_cleanup(self):
-        """Test temporary directory cleanup."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            source_dir = Path(temp_dir) / "source"
-            source_dir.mkdir()
-            (source_dir / "index.html").write_text("<html></html>")
-
-            viewer = HTMLViewer()
+@pytest.mark.parametrize(
+    "args,expected",
+    [
+        (("Test App", 800, 600), ("Test App", 800, 600)),
+        ((), ("HTML2exe", 1024, 768)),
+    ],
+)
+def test_initialization(args, expected):
+    """Test viewer initialization with explicit and default parameters."""
+    viewer = HTMLViewer(*args)
+
+    assert (viewer.title, viewer.width, viewer.height) == expected
+    assert viewer._temp_dir is None
+
+
+def test_extract_assets(tmp_path):
+    """Test asset extraction and cleanup."""
+    # Create source assets
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "index.html").write_text("<html><body>Test</body></html>")
+    (source_dir / "style.css").write_text("body { margin: 0; }")
+
+    viewer = HTMLViewer()
+    try:
+        assets_dir = viewer.extract_assets(source_dir)
+
+        assert assets_dir.exists()
+        assert (assets_dir / "index.html").exists()
+        assert (assets_dir / "style.css").exists()
+        assert viewer._temp_dir is not None
+    finally:
+        viewer.cleanup()
+
+    assert viewer._temp_dir is None
+
+    # Cleanup is idempotent
+    viewer.cleanup()
+
+
+def test_extract_assets_hard_links_files(monkeypatch, tmp_path):
+    """Test extracted files are hard links to the source files."""
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "index.html").write_text("<html></html>")
+    # Extract onto the same filesystem as the source so linking can succeed
+    extract_root = tmp_path / "extract"
+    extract_root.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(extract_root))
+
+    viewer = HTMLViewer()
+    try:
+        assets_dir = viewer.extract_assets(source_dir)
+
+        source_stat = os.stat(source_dir / "index.html")
+        extracted_stat = os.stat(assets_dir / "index.html")
+        assert extracted_stat.st_ino == source_stat.st_ino
+        assert extracted_stat.st_nlink == 2
+    finally:
+        viewer.cleanup()
+
+
+def test_extract_assets_links_into_temp_dir(monkeypatch, tmp_path):
+    """Test extraction hard-links the source tree into the viewer's temp dir."""
+    calls = []
+    monkeypatch.setattr(
+        "html2exe.viewer.shutil.copytree", lambda *a, **k: calls.append((a, k))
+    )
+
+    viewer = HTMLViewer()
+    try:
+        assets_dir = viewer.extract_assets(tmp_path)
+
+        assert assets_dir == viewer._temp_dir / "html_assets"
+        assert calls == [((tmp_path, assets_dir), {"copy_function": os.link})]
+    finally:
+        viewer.cleanup()
+
+
+def test_extract_assets_copy_fallback(monkeypatch, tmp_path):
+    """Test extraction falls back to copying when hard links fail."""
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "index.html").write_text("<html><body>Test</body></html>")
+
+    def failing_link(src, dst):
+        raise OSError("cross-device link")
+
+    viewer = HTMLViewer()
+    try:
+        with monkeypatch.context() as m:
+            m.setattr("html2exe.viewer.os.link", failing_link)
             assets_dir = viewer.extract_assets(source_dir)
+
+        assert (
+            assets_dir / "index.html"
+        ).read_text() == "<html><body>Test</body></html>"
+    finally:
+        viewer.cleanup()
+
+
+def test_view_cleans_up(tmp_path):
+    """Test view removes extracted assets when the block exits."""
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    (source_dir / "index.html").write_text("<html></html>")
+
+    viewer = HTMLViewer()
+    with pytest.raises(KeyError):
+        with viewer.view(source_dir) as assets_dir:
+            assert (assets_dir / "index.html").exists()
             temp_path = viewer._temp_dir
+            raise KeyError("boom")
+
+    assert viewer._temp_dir is None
+    assert not temp_path.exists()
+
+
+def test_extract_nonexistent_assets():
+    """Test error handling for nonexistent assets."""
+    # The missing source must be rejected before mkdtemp allocates a temp dir
+    viewer = HTMLViewer()
+
+    with pytest.raises(RuntimeError, match="Assets not found"):
+        viewer.extract_assets(Path("nonexistent"))
+
+    assert viewer._temp_dir is None
+
+
+def test_cleanup_tolerates_missing_temp_dir(tmp_path):
+    """Test cleanup resets state even if the temp dir is already gone."""
+    viewer = HTMLViewer()
+    viewer._temp_dir = tmp_path / "already-removed"
+
+    viewer.cleanup()
+
+    assert viewer._temp_dir is None
+
 
-            viewer.cleanup()
+def test_show_without_pywebview(monkeypatch):
+    """Test show reports a missing pywebview install."""
+    monkeypatch.setitem(sys.modules, "webview", None)
+    viewer = HTMLViewer()
 
-            assert viewer._temp_dir is None
-            # Note: temp directory may still exist due to OS cleanup timing
+    with pytest.raises(RuntimeError, match="pywebview is required"):
+        viewer.show(Path("index.html"))